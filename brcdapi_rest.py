@@ -63,22 +63,24 @@ such as the brcddb libraries, to control what gets printed to the log.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.2     | 06 Dec 2024   | Replaced old header format with standard file header.                                 |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.3     | 17 Oct 2026   | Clear the URIs by method saved in the session when the supported methods change.      |
+|           |               | pprint is only imported when formatting errors or verbose debug output.               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024 Consoli Solutions, LLC'
-__date__ = '06 Dec 2024'
+__date__ = '17 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack@consoli-solutions.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.2'
+__version__ = '4.0.3'
 
 import http.client
 import re
 import json
 import time
-import pprint
 import os
 import brcdapi.fos_cli as fos_cli
 import brcdapi.fos_auth as fos_auth
@@ -127,6 +129,7 @@ def _format_op_status(obj):
     except (AttributeError, TypeError):
         rl.append('Invalid status response type: ' + str(type(obj)))
     if len(rl) > 0:
+        import pprint
         rl.append('Check the log for details')
         brcdapi_log.exception([rl[0], pprint.pformat(obj)])
         return rl
@@ -137,6 +140,7 @@ def _format_op_status(obj):
                 if k1 == 'message':
                     rl.extend(gen_util.convert_to_list(v1))
                 else:  # Future proofing or bug in FOS
+                    import pprint
                     rl.append('Unknown key: ' + str(k1))
                     rl.extend([b.rstrip() for b in pprint.pformat(v1).replace('\r\n', '\n').split('\n')])
         else:
@@ -237,6 +241,7 @@ def _add_methods(session, http_response, in_uri):
             if len(t) >= 2:
                 if isinstance(t[0], str) and t[0] == 'Allow':
                     cntl_d.update(op=brcdapi_util.op_yes, methods=t[1].replace(' ', '').split(','))
+                    session.update(_method_d=None)  # The methods changed so brcdapi_util.uris_for_method() starts over
                     return
     cntl_d.update(op=brcdapi_util.op_not_supported)
 
@@ -296,6 +301,7 @@ def _api_request(session, uri, http_method, content):
         _api_request(session, uri, 'OPTIONS', dict())
 
     if _verbose_debug:
+        import pprint
         buf = ['_api_request() - Send:', 'Method: ' + http_method, 'URI: ' + uri, 'content:', pprint.pformat(content)]
         brcdapi_log.log(buf, echo=True)
 
@@ -334,6 +340,7 @@ def _api_request(session, uri, http_method, content):
                 else:
                     _add_methods(session, http_response, uri)
             if _verbose_debug:
+                import pprint
                 brcdapi_log.log(['_api_request() - Response:', pprint.pformat(json_data)], echo=True)
     except TimeoutError:
         buf = 'Time out processing ' + uri + '. Method: ' + http_method
@@ -518,6 +525,7 @@ def get_request(session, ruri, fid=None):
             json_data = json.load(f)
             f.close()
             if _verbose_debug:
+                import pprint
                 ml = ['api_request() - Send:',
                       'Method: GET', 'URI: ' + brcdapi_util.format_uri(session, ruri, fid),
                       'api_request() - Response:',
@@ -90,6 +90,8 @@ Login Session::
     +-------------------+-------------------------------------------------------------------------------------------+
     | uri_map           | dict: See brcdapi.util.add_uri_map() for details.                                         |
     +-------------------+-------------------------------------------------------------------------------------------+
+    | uri_flat          | dict: Leaves of uri_map keyed by path. See brcdapi.util.add_uri_map() for details.        |
+    +-------------------+-------------------------------------------------------------------------------------------+
 
 Version Control::
 
@@ -100,22 +102,24 @@ Version Control::
     +-----------+---------------+-----------------------------------------------------------------------------------+
     | 4.0.1     | 06 Mar 2024   | Added user_id and user_pw to dict returned from login()                           |
     +-----------+---------------+-----------------------------------------------------------------------------------+
+    | 4.0.2     | 17 Oct 2026   | Added uri_flat to the session description. pprint is only imported when           |
+    |           |               | formatting errors.                                                                |
+    +-----------+---------------+-----------------------------------------------------------------------------------+
 """
 
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024 Consoli Solutions, LLC'
-__date__ = '06 Mar 2024'
+__date__ = '17 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack@consoli-solutions.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.1'
+__version__ = '4.0.2'
 
 import http.client as httplib
 import base64
 import ssl
 import json
-import pprint
 import brcdapi.util as brcdapi_util
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
@@ -236,6 +240,7 @@ def is_error(obj):
         if status < 200 or status >= 300:
             return True
         if 'errors' in obj:
+            import pprint
             brcdapi_log.exception(['', 'Response contains good status and errors:', pprint.pformat(obj), ''], echo=True)
         return False
     if 'errors' in obj:
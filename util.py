@@ -41,6 +41,8 @@ Only GET is valid in the 'methods' leaf of uti_map
 | add_uri_map           | Builds out the URI map and adds it to the session. Intended to be called once         |
 |                       | immediately after login                                                               |
 +-----------------------+---------------------------------------------------------------------------------------+
+| cli_to_api            | Converts a MAPS rule action entered using CLI syntax to API syntax                    |
++-----------------------+---------------------------------------------------------------------------------------+
 | format_uri            | Formats a full URI                                                                    |
 +-----------------------+---------------------------------------------------------------------------------------+
 | fos_to_dict           | Converts a FOS version into a dictionary to be used for comparing for version numbers |
@@ -53,6 +55,9 @@ Only GET is valid in the 'methods' leaf of uti_map
 +-----------------------+---------------------------------------------------------------------------------------+
 | uri_d                 | Returns the dictionary in the URI map for a specified URI                             |
 +-----------------------+---------------------------------------------------------------------------------------+
+| UriObj                | IntEnum of the object types used in area in the URI map. The xxx_OBJ module level     |
+|                       | names are aliases for its members.                                                    |
++-----------------------+---------------------------------------------------------------------------------------+
 | validate_fid          | Validates a FID or list of FIDs                                                       |
 +-----------------------+---------------------------------------------------------------------------------------+
 | vfid_to_str           | Converts a FID to a string, '?vf-id=xx' to be appended to a URI that requires a FID   |
@@ -77,18 +82,25 @@ Only GET is valid in the 'methods' leaf of uti_map
 +-----------+---------------+-----------------------------------------------------------------------------------+
 | 4.0.5     | 26 Dec 2024   | Updated comments only.                                                            |
 +-----------+---------------+-----------------------------------------------------------------------------------+
+| 4.0.6     | 17 Oct 2026   | Performance improvements to the URI map and associated lookup methods. Added      |
+|           |               | cli_to_api(). mask_ip_addr() masks IPv6 addresses. pprint is only imported when   |
+|           |               | there are errors to format.                                                       |
++-----------+---------------+-----------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024 Consoli Solutions, LLC'
-__date__ = '26 Dec 2024'
+__date__ = '17 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack@consoli-solutions.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.0.6'
 
-import pprint
-import copy
+import sys
+import functools
+import ipaddress
+import types
+import enum
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 
@@ -458,10 +470,14 @@ class VirtualFabricIdError(Exception):
 
 
 _VF_ID = '?vf-id='
+# Return values for vfid_to_str() indexed by FID. Since FIDs must be in the range 1-128, index 0 is never used.
+_vf_id_str_t = tuple(sys.intern(_VF_ID + str(i)) for i in range(0, 129))
+# Maximum number of URIs format_uri() saves in a session before starting over. Well above what any script normally uses
+_FORMAT_URI_MAX = 4096
 # sfp_rules.xlsx actions may have been entered using CLI syntax so this table converts the CLI syntax to API syntax.
 # Note that only actions with different syntax are converted. Actions not in this table are assumed to be correct API
-# syntax.
-_cli_to_api_convert = dict(
+# syntax. It is read only. Use cli_to_api() to convert an action.
+_cli_to_api_convert = types.MappingProxyType(dict(
     fence='port-fence',
     snmp='snmp-trap',
     unquar='un-quarantine',
@@ -472,17 +488,33 @@ _cli_to_api_convert = dict(
     sw_marginal='sw-marginal',
     sw_critical='sw-critical',
     sfp_marginal='sfp-marginal',
-)
-# Used in area in default_uri_map
-NULL_OBJ = 0  # Actions on this KPI are either not supported or I didn't know what to do with them yet.
-SESSION_OBJ = NULL_OBJ + 1
-CHASSIS_OBJ = SESSION_OBJ + 1  # URI is associated with a physical chassis
-CHASSIS_SWITCH_OBJ = CHASSIS_OBJ + 1   # URI is associated with a physical chassis containing switch objects
-SWITCH_OBJ = CHASSIS_SWITCH_OBJ + 1  # URI is associated with a logical switch
-SWITCH_PORT_OBJ = SWITCH_OBJ + 1  # URI is associated with a logical switch containing port objects
-FABRIC_OBJ = SWITCH_PORT_OBJ + 1  # URI is associated with a fabric
-FABRIC_SWITCH_OBJ = FABRIC_OBJ + 1  # URI is associated with a fabric containing switch objects
-FABRIC_ZONE_OBJ = FABRIC_SWITCH_OBJ + 1  # URI is associated with a fabric containing zoning objects
+))
+
+
+@enum.unique
+class UriObj(enum.IntEnum):
+    """Used in area in default_uri_map. Members are int so they can be compared to, and used as, integers"""
+    NULL_OBJ = 0  # Actions on this KPI are either not supported or I didn't know what to do with them yet.
+    SESSION_OBJ = 1
+    CHASSIS_OBJ = 2  # URI is associated with a physical chassis
+    CHASSIS_SWITCH_OBJ = 3  # URI is associated with a physical chassis containing switch objects
+    SWITCH_OBJ = 4  # URI is associated with a logical switch
+    SWITCH_PORT_OBJ = 5  # URI is associated with a logical switch containing port objects
+    FABRIC_OBJ = 6  # URI is associated with a fabric
+    FABRIC_SWITCH_OBJ = 7  # URI is associated with a fabric containing switch objects
+    FABRIC_ZONE_OBJ = 8  # URI is associated with a fabric containing zoning objects
+
+
+# The module level names predate UriObj and are used by other libraries so they are retained as aliases
+NULL_OBJ = UriObj.NULL_OBJ
+SESSION_OBJ = UriObj.SESSION_OBJ
+CHASSIS_OBJ = UriObj.CHASSIS_OBJ
+CHASSIS_SWITCH_OBJ = UriObj.CHASSIS_SWITCH_OBJ
+SWITCH_OBJ = UriObj.SWITCH_OBJ
+SWITCH_PORT_OBJ = UriObj.SWITCH_PORT_OBJ
+FABRIC_OBJ = UriObj.FABRIC_OBJ
+FABRIC_SWITCH_OBJ = UriObj.FABRIC_SWITCH_OBJ
+FABRIC_ZONE_OBJ = UriObj.FABRIC_ZONE_OBJ
 
 op_no = 0  # Used in the op field in session
 op_not_supported = 1
@@ -518,309 +550,424 @@ for each type were added because it does not appear that anyone in engineering i
 |               |           |           |       | and methods as with "root".                                       |
 +---------------+-----------+-----------+-------+-------------------------------------------------------------------+
 """
-default_uri_map = {
-    'auth-token': dict(area=NULL_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-    'brocade-module-version': dict(area=NULL_OBJ, fid=False, methods=()),
-    'brocade-module-version/module': dict(area=NULL_OBJ, fid=False, methods=('GET', 'HEAD', 'OPTIONS')),
-    'login': dict(area=SESSION_OBJ, fid=False, methods=('POST',)),
-    'logout': dict(area=SESSION_OBJ, fid=False, methods=('POST',)),
-    'running': {
-        'brocade-fibrechannel-switch': {
-            'fibrechannel-switch': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'switch-fabric-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'topology-domain': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'topology-route': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'topology-error': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-application-server': {
-           'application-server-device': dict(area=CHASSIS_OBJ, id=False, methods=('GET', 'HEAD', 'OPTIONS')),
-        },
-        'brocade-fibrechannel-logical-switch': {
-            'fibrechannel-logical-switch': dict(area=CHASSIS_SWITCH_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-interface': {
-            'fibrechannel': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fibrechannel-statistics': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fibrechannel-performance': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fibrechannel-statistics-db': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'extension-ip-interface': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('GET', 'DELETE')),
-            'fibrechannel-lag': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'gigabitethernet': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'gigabitethernet-statistics': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'logical-e-port': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'portchannel': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'portchannel-statistics': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fibrechannel-router-statistics': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-media': {
-            'media-rdp': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fabric': {
-            'access-gateway': dict(area=FABRIC_SWITCH_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'fabric-switch': dict(area=FABRIC_SWITCH_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fibrechannel-routing': {
-            'routing-configuration': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lsan-zone': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lsan-device': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'edge-fabric-alias': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fibrechannel-router': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'router-statistics': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'proxy-config': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'translate-domain-config': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'stale-translate-domain': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-         },
-        'brocade-zone': {
-            'defined-configuration': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'effective-configuration': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fabric-lock': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fibrechannel-diagnostics': {
-            'fibrechannel-diagnostics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fdmi': {
-            'hba': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'port': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-name-server': {
-            'fibrechannel-name-server': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fabric-traffic-controller': {
-            'fabric-traffic-controller-device': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fibrechannel-configuration': {
-            'switch-configuration': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'f-port-login-settings': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'port-configuration': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'zone-configuration': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fabric': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'chassis-config-settings': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fos-settings': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-logging': {
-            'audit': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'syslog-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'log-setting': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'log-quiet-control': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'raslog': dict(area=CHASSIS_OBJ, fid=False,  methods=('OPTIONS', 'GET')),
-            'raslog-module': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'supportftp': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'error-log': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'audit-log': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-session-login-information': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fibrechannel-trunk': {
-            'trunk': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'performance': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'trunk-area': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-ficon': {
-            'cup': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'logical-path': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'rnid': dict(area=SWITCH_PORT_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'switch-rnid': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lirr': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'rlir': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-fru': {
-            'power-supply': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'fan': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'blade': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'history-log': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sensor': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'wwn': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-chassis': {
-            'chassis': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ha-status': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'credit-recovery': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-interface-configuration': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-ethernet-interface': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-port-track-configuration':  dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-port-connection-statistics': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sn-chassis': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'version': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-maps': {
-            'maps-config': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'rule': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'maps-policy': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'group': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'dashboard-rule': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'dashboard-history': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'dashboard-misc': dict(area=SWITCH_OBJ, fid=True, methods=('GET', 'PUT')),
-            'credit-stall-dashboard': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'oversubscription-dashboard': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'system-resources': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'paused-cfg': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'monitoring-system-matrix': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'switch-status-policy-report': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'fpi-profile': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'maps-violation': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'backend-ports-history': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'gigabit-ethernet-ports-history': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'maps-device-login': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'quarantined-devices': dict(area=SWITCH_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-time': {
-            'clock-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'time-zone': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ntp-clock-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ntp-clock-server-key': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-security': {
-            'sec-crypto-cfg': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sec-crypto-cfg-template': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sec-crypto-cfg-template-action': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS',)),
-            'password-cfg': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'user-specific-password-cfg': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'user-config': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ldap-role-map': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sshutil': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sshutil-key': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sshutil-known-host': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sshutil-public-key': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'sshutil-public-key-action': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS',)),
-            'password': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS',)),
-            'security-certificate-generate': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS',)),
-            'security-certificate-action': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'DELETE')),
-            'security-certificate': dict(area=CHASSIS_OBJ, fid=False,  methods=('OPTIONS', 'GET')),
-            'radius-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'tacacs-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ldap-server': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'auth-spec': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ipfilter-policy': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ipfilter-rule': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'security-certificate-extension': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'role-config': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'rbac-class': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-rbac-map': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'security-violation-statistics': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'acl-policy': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'defined-fcs-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'active-fcs-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'defined-scc-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'active-scc-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'defined-dcc-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'active-dcc-policy-member-list': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'security-policy-size': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'authentication-configuration': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'dh-chap-authentication-secret': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'policy-distribution-config': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-license': {
-            'license': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'ports-on-demand-license-info': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'end-user-license-agreement': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-snmp': {
-            'system': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'mib-capability': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'trap-capability': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'v1-account': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'v1-trap': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'v3-account': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'v3-trap': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'access-control': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-management-ip-interface': {
-            'management-ip-interface': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-interface-lldp-neighbor': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'management-interface-lldp-statistics': dict(area=CHASSIS_OBJ, fid=False,  methods=('OPTIONS', 'GET')),
-        },
-        'brocade-firmware': {
-            'firmware-history': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-            'firmware-config': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-dynamic-feature-tracking': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        'brocade-usb': {
-            'usb-file': dict(area=CHASSIS_OBJ, fid=False, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-extension-ip-route': {
-            'extension-ip-route': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-extension-ipsec-policy': {
-            'extension-ipsec-policy': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-extension-tunnel': {  # I think some of these should be SWITCH_PORT_OBJ
-            'extension-tunnel': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'extension-tunnel-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'extension-circuit': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'extension-circuit-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'circuit-qos-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'circuit-interval-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'wan-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'wan-statistics-v1': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-extension': {
-            'traffic-control-list': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'dp-hcl-status': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'global-lan-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lan-flow-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-lldp': {
-            'lldp-neighbor': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lldp-profile': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lldp-statistics': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'lldp-global': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-        'brocade-supportlink': {
-            'supportlink-profile': dict(area=CHASSIS_OBJ, fid=False, methods=('GET', 'PATCH', 'HEAD', 'OPTIONS')),
-            'supportlink-history': dict(area=CHASSIS_OBJ, fid=False, methods=('GET', 'PATCH', 'HEAD', 'OPTIONS')),
-        },
-        'brocade-traffic-optimizer': {
-            'performance-group-profile': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'performance-group-flows': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-            'performance-group': dict(area=FABRIC_OBJ, fid=True, methods=('OPTIONS', 'GET')),
-        },
-    },
-    'operations': {
-        'brocade-diagnostics': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'configdownload': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'configupload': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'date': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'extension': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'factory-reset': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'fibrechannel-fabric': dict(area=NULL_OBJ, fid=True,  methods=('POST', 'OPTIONS')),
-        'fibrechannel-zone': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'firmwaredownload': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'lldp': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'management-ethernet-interface': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'ntp-clock-server': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'port': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'port-decommission': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'reboot': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'restart': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'sdd-quarantine': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'security-acl-policy': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'security-ipfilter': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'security-reset-violation-statistics': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'security-policy-distribute': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'security-policy-chassis-distribute': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'security-fabric-wide-policy-distribute': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'security-authentication-secret': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'security-authentication-configuration': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'security-role-clone': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'security-certificate': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'show-status': {'area': NULL_OBJ, 'fid': False, 'methods': ('POST',),
-                        'message-id': dict(area=NULL_OBJ, fid=False, methods=('POST',))},
-        'supportsave': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'traffic-optimizer': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'device-management': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'license': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'pcie-health': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'pcie-health-test': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'fabric': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'supportlink': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'usb-delete-file': dict(area=NULL_OBJ, fid=False, methods=('POST', 'OPTIONS')),
-        'portchannel': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-        'device-login-rebalance': dict(area=NULL_OBJ, fid=True, methods=('POST', 'OPTIONS')),
-    },
-}
+# Method tuples shared by the leaves in the default URI map. Most leaves support the same methods so each leaf
+# references one of these rather than its own tuple.
+_M_OPT_GET = ('OPTIONS', 'GET')
+_M_POST_OPT = ('POST', 'OPTIONS')
+_M_POST = ('POST',)
+_M_OPT = ('OPTIONS',)
+_M_GET_HEAD_OPT = ('GET', 'HEAD', 'OPTIONS')
+_M_GET_PATCH_HEAD_OPT = ('GET', 'PATCH', 'HEAD', 'OPTIONS')
+
+
+def _build_default_uri_map():
+    """Builds the default URI map described above. Only called once, via _get_default_uri_map().
+
+    The map is built from a table rather than a nested literal. Each entry is (branch, leaves) where branch is the
+    "/" separated path to the dictionary the leaves are added to ('' for the root) and each leaf is the tuple (key,
+    area, fid, methods). Keys are interned as the map is built.
+
+    :return: Default URI map
+    :rtype: dict
+    """
+    uri_rows = (
+        ('', (
+            ('auth-token', NULL_OBJ, True, _M_OPT_GET),
+            ('brocade-module-version', NULL_OBJ, False, ()),
+            ('brocade-module-version/module', NULL_OBJ, False, _M_GET_HEAD_OPT),
+            ('login', SESSION_OBJ, False, _M_POST),
+            ('logout', SESSION_OBJ, False, _M_POST),
+        )),
+        ('running/brocade-fibrechannel-switch', (
+            ('fibrechannel-switch', FABRIC_OBJ, True, _M_OPT_GET),
+            ('switch-fabric-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('topology-domain', FABRIC_OBJ, True, _M_OPT_GET),
+            ('topology-route', FABRIC_OBJ, True, _M_OPT_GET),
+            ('topology-error', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-application-server', (
+            ('application-server-device', CHASSIS_OBJ, None, _M_GET_HEAD_OPT),
+        )),
+        ('running/brocade-fibrechannel-logical-switch', (
+            ('fibrechannel-logical-switch', CHASSIS_SWITCH_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-interface', (
+            ('fibrechannel', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('fibrechannel-statistics', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('fibrechannel-performance', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('fibrechannel-statistics-db', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('extension-ip-interface', SWITCH_PORT_OBJ, True, ('GET', 'DELETE')),
+            ('fibrechannel-lag', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('gigabitethernet', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('gigabitethernet-statistics', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('logical-e-port', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('portchannel', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('portchannel-statistics', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('fibrechannel-router-statistics', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-media', (
+            ('media-rdp', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fabric', (
+            ('access-gateway', FABRIC_SWITCH_OBJ, False, _M_OPT_GET),
+            ('fabric-switch', FABRIC_SWITCH_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-fibrechannel-routing', (
+            ('routing-configuration', SWITCH_OBJ, True, _M_OPT_GET),
+            ('lsan-zone', SWITCH_OBJ, True, _M_OPT_GET),
+            ('lsan-device', SWITCH_OBJ, True, _M_OPT_GET),
+            ('edge-fabric-alias', SWITCH_OBJ, True, _M_OPT_GET),
+            ('fibrechannel-router', SWITCH_OBJ, True, _M_OPT_GET),
+            ('router-statistics', SWITCH_OBJ, True, _M_OPT_GET),
+            ('proxy-config', SWITCH_OBJ, True, _M_OPT_GET),
+            ('translate-domain-config', SWITCH_OBJ, True, _M_OPT_GET),
+            ('stale-translate-domain', SWITCH_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-zone', (
+            ('defined-configuration', FABRIC_OBJ, True, _M_OPT_GET),
+            ('effective-configuration', FABRIC_OBJ, True, _M_OPT_GET),
+            ('fabric-lock', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fibrechannel-diagnostics', (
+            ('fibrechannel-diagnostics', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fdmi', (
+            ('hba', FABRIC_OBJ, True, _M_OPT_GET),
+            ('port', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-name-server', (
+            ('fibrechannel-name-server', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fabric-traffic-controller', (
+            ('fabric-traffic-controller-device', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fibrechannel-configuration', (
+            ('switch-configuration', SWITCH_OBJ, True, _M_OPT_GET),
+            ('f-port-login-settings', SWITCH_OBJ, True, _M_OPT_GET),
+            ('port-configuration', SWITCH_OBJ, True, _M_OPT_GET),
+            ('zone-configuration', SWITCH_OBJ, True, _M_OPT_GET),
+            ('fabric', SWITCH_OBJ, True, _M_OPT_GET),
+            ('chassis-config-settings', SWITCH_OBJ, True, _M_OPT_GET),
+            ('fos-settings', SWITCH_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-logging', (
+            ('audit', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('syslog-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('log-setting', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('log-quiet-control', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('raslog', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('raslog-module', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('supportftp', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('error-log', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('audit-log', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-session-login-information', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-fibrechannel-trunk', (
+            ('trunk', SWITCH_OBJ, True, _M_OPT_GET),
+            ('performance', SWITCH_OBJ, True, _M_OPT_GET),
+            ('trunk-area', SWITCH_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-ficon', (
+            ('cup', SWITCH_OBJ, True, _M_OPT_GET),
+            ('logical-path', SWITCH_OBJ, True, _M_OPT_GET),
+            ('rnid', SWITCH_PORT_OBJ, True, _M_OPT_GET),
+            ('switch-rnid', SWITCH_OBJ, True, _M_OPT_GET),
+            ('lirr', SWITCH_OBJ, True, _M_OPT_GET),
+            ('rlir', SWITCH_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-fru', (
+            ('power-supply', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('fan', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('blade', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('history-log', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sensor', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('wwn', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-chassis', (
+            ('chassis', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ha-status', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('credit-recovery', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-interface-configuration', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-ethernet-interface', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-port-track-configuration', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-port-connection-statistics', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sn-chassis', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('version', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-maps', (
+            ('maps-config', SWITCH_OBJ, True, _M_OPT_GET),
+            ('rule', SWITCH_OBJ, True, _M_OPT_GET),
+            ('maps-policy', SWITCH_OBJ, True, _M_OPT_GET),
+            ('group', SWITCH_OBJ, True, _M_OPT_GET),
+            ('dashboard-rule', SWITCH_OBJ, True, _M_OPT_GET),
+            ('dashboard-history', SWITCH_OBJ, True, _M_OPT_GET),
+            ('dashboard-misc', SWITCH_OBJ, True, ('GET', 'PUT')),
+            ('credit-stall-dashboard', SWITCH_OBJ, True, _M_OPT_GET),
+            ('oversubscription-dashboard', SWITCH_OBJ, True, _M_OPT_GET),
+            ('system-resources', SWITCH_OBJ, True, _M_OPT_GET),
+            ('paused-cfg', SWITCH_OBJ, True, _M_OPT_GET),
+            ('monitoring-system-matrix', SWITCH_OBJ, True, _M_OPT_GET),
+            ('switch-status-policy-report', SWITCH_OBJ, True, _M_OPT_GET),
+            ('fpi-profile', SWITCH_OBJ, True, _M_OPT_GET),
+            ('maps-violation', SWITCH_OBJ, True, _M_OPT_GET),
+            ('backend-ports-history', SWITCH_OBJ, True, _M_OPT_GET),
+            ('gigabit-ethernet-ports-history', SWITCH_OBJ, True, _M_OPT_GET),
+            ('maps-device-login', SWITCH_OBJ, True, _M_OPT_GET),
+            ('quarantined-devices', SWITCH_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-time', (
+            ('clock-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('time-zone', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ntp-clock-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ntp-clock-server-key', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-security', (
+            ('sec-crypto-cfg', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sec-crypto-cfg-template', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sec-crypto-cfg-template-action', CHASSIS_OBJ, False, _M_OPT),
+            ('password-cfg', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('user-specific-password-cfg', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('user-config', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ldap-role-map', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sshutil', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sshutil-key', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sshutil-known-host', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sshutil-public-key', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('sshutil-public-key-action', CHASSIS_OBJ, False, _M_OPT),
+            ('password', CHASSIS_OBJ, False, _M_OPT),
+            ('security-certificate-generate', CHASSIS_OBJ, False, _M_OPT),
+            ('security-certificate-action', CHASSIS_OBJ, False, ('OPTIONS', 'DELETE')),
+            ('security-certificate', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('radius-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('tacacs-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ldap-server', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('auth-spec', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ipfilter-policy', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ipfilter-rule', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('security-certificate-extension', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('role-config', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('rbac-class', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-rbac-map', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('security-violation-statistics', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('acl-policy', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('defined-fcs-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('active-fcs-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('defined-scc-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('active-scc-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('defined-dcc-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('active-dcc-policy-member-list', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('security-policy-size', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('authentication-configuration', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('dh-chap-authentication-secret', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('policy-distribution-config', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-license', (
+            ('license', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('ports-on-demand-license-info', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('end-user-license-agreement', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-snmp', (
+            ('system', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('mib-capability', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('trap-capability', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('v1-account', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('v1-trap', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('v3-account', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('v3-trap', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('access-control', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-management-ip-interface', (
+            ('management-ip-interface', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-interface-lldp-neighbor', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('management-interface-lldp-statistics', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-firmware', (
+            ('firmware-history', CHASSIS_OBJ, False, _M_OPT_GET),
+            ('firmware-config', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running', (
+            ('brocade-dynamic-feature-tracking', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-usb', (
+            ('usb-file', CHASSIS_OBJ, False, _M_OPT_GET),
+        )),
+        ('running/brocade-extension-ip-route', (
+            ('extension-ip-route', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-extension-ipsec-policy', (
+            ('extension-ipsec-policy', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-extension-tunnel', (
+            ('extension-tunnel', FABRIC_OBJ, True, _M_OPT_GET),
+            ('extension-tunnel-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('extension-circuit', FABRIC_OBJ, True, _M_OPT_GET),
+            ('extension-circuit-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('circuit-qos-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('circuit-interval-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('wan-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('wan-statistics-v1', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-extension', (
+            ('traffic-control-list', FABRIC_OBJ, True, _M_OPT_GET),
+            ('dp-hcl-status', FABRIC_OBJ, True, _M_OPT_GET),
+            ('global-lan-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('lan-flow-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-lldp', (
+            ('lldp-neighbor', FABRIC_OBJ, True, _M_OPT_GET),
+            ('lldp-profile', FABRIC_OBJ, True, _M_OPT_GET),
+            ('lldp-statistics', FABRIC_OBJ, True, _M_OPT_GET),
+            ('lldp-global', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('running/brocade-supportlink', (
+            ('supportlink-profile', CHASSIS_OBJ, False, _M_GET_PATCH_HEAD_OPT),
+            ('supportlink-history', CHASSIS_OBJ, False, _M_GET_PATCH_HEAD_OPT),
+        )),
+        ('running/brocade-traffic-optimizer', (
+            ('performance-group-profile', FABRIC_OBJ, True, _M_OPT_GET),
+            ('performance-group-flows', FABRIC_OBJ, True, _M_OPT_GET),
+            ('performance-group', FABRIC_OBJ, True, _M_OPT_GET),
+        )),
+        ('operations', (
+            ('brocade-diagnostics', NULL_OBJ, False, _M_POST_OPT),
+            ('configdownload', NULL_OBJ, False, _M_POST_OPT),
+            ('configupload', NULL_OBJ, False, _M_POST_OPT),
+            ('date', NULL_OBJ, False, _M_POST_OPT),
+            ('extension', NULL_OBJ, True, _M_POST_OPT),
+            ('factory-reset', NULL_OBJ, False, _M_POST_OPT),
+            ('fibrechannel-fabric', NULL_OBJ, True, _M_POST_OPT),
+            ('fibrechannel-zone', NULL_OBJ, True, _M_POST_OPT),
+            ('firmwaredownload', NULL_OBJ, False, _M_POST_OPT),
+            ('lldp', NULL_OBJ, True, _M_POST_OPT),
+            ('management-ethernet-interface', NULL_OBJ, False, _M_POST_OPT),
+            ('ntp-clock-server', NULL_OBJ, False, _M_POST_OPT),
+            ('port', NULL_OBJ, True, _M_POST_OPT),
+            ('port-decommission', NULL_OBJ, True, _M_POST_OPT),
+            ('reboot', NULL_OBJ, False, _M_POST_OPT),
+            ('restart', NULL_OBJ, False, _M_POST_OPT),
+            ('sdd-quarantine', NULL_OBJ, True, _M_POST_OPT),
+            ('security-acl-policy', NULL_OBJ, True, _M_POST_OPT),
+            ('security-ipfilter', NULL_OBJ, True, _M_POST_OPT),
+            ('security-reset-violation-statistics', NULL_OBJ, False, _M_POST_OPT),
+            ('security-policy-distribute', NULL_OBJ, True, _M_POST_OPT),
+            ('security-policy-chassis-distribute', NULL_OBJ, False, _M_POST_OPT),
+            ('security-fabric-wide-policy-distribute', NULL_OBJ, True, _M_POST_OPT),
+            ('security-authentication-secret', NULL_OBJ, False, _M_POST_OPT),
+            ('security-authentication-configuration', NULL_OBJ, False, _M_POST_OPT),
+            ('security-role-clone', NULL_OBJ, False, _M_POST_OPT),
+            ('security-certificate', NULL_OBJ, False, _M_POST_OPT),
+            ('show-status', NULL_OBJ, False, _M_POST),
+            ('supportsave', NULL_OBJ, False, _M_POST_OPT),
+            ('traffic-optimizer', NULL_OBJ, True, _M_POST_OPT),
+            ('device-management', NULL_OBJ, False, _M_POST_OPT),
+            ('license', NULL_OBJ, False, _M_POST_OPT),
+            ('pcie-health', NULL_OBJ, False, _M_POST_OPT),
+            ('pcie-health-test', NULL_OBJ, False, _M_POST_OPT),
+            ('fabric', NULL_OBJ, True, _M_POST_OPT),
+            ('supportlink', NULL_OBJ, False, _M_POST_OPT),
+            ('usb-delete-file', NULL_OBJ, False, _M_POST_OPT),
+            ('portchannel', NULL_OBJ, True, _M_POST_OPT),
+            ('device-login-rebalance', NULL_OBJ, True, _M_POST_OPT),
+        )),
+        ('operations/show-status', (
+            ('message-id', NULL_OBJ, False, _M_POST),
+        )),
+    )
+    rd = dict()
+    for branch, leaf_l in uri_rows:
+        branch_d = rd
+        for k in branch.split('/') if len(branch) > 0 else list():
+            branch_d = branch_d.setdefault(sys.intern(k), dict())
+        for k, area, fid, methods in leaf_l:
+            branch_d.setdefault(sys.intern(k), dict()).update(area=area, fid=fid, methods=methods)
+
+    return rd
+
+
+_default_uri_map_d = None
+
+
+def _get_default_uri_map():
+    """Returns default_uri_map. The map is not built until the first time it is needed.
+
+    :return: Default URI map
+    :rtype: dict
+    """
+    global _default_uri_map_d
+
+    if _default_uri_map_d is None:
+        _default_uri_map_d = _build_default_uri_map()
+    return _default_uri_map_d
+
+
+def _flat_map_nodes(map_d, prefix, rd):
+    """Adds every dictionary, leaf or branch, in a URI map to a flat dictionary keyed by path
+
+    :param map_d: URI map, or a branch of a URI map
+    :type map_d: dict
+    :param prefix: Path to map_d with a trailing '/'. An empty string for the root.
+    :type prefix: str
+    :param rd: Flat dictionary to add to
+    :type rd: dict
+    :return: rd
+    :rtype: dict
+    """
+    for k, d in map_d.items():
+        if isinstance(d, dict):
+            path = sys.intern(prefix + k)
+            rd[path] = d
+            _flat_map_nodes(d, path + '/', rd)
+
+    return rd
+
+
+_default_uri_flat_d = None
+
+
+def _get_default_uri_flat():
+    """Returns every dictionary in default_uri_map keyed by path. Used by add_uri_map() to find the default settings for
+    a URI with a single lookup. Built the first time it is needed.
+
+    :return: Key is the path. Value is the dictionary in default_uri_map (not a copy)
+    :rtype: dict
+    """
+    global _default_uri_flat_d
+
+    if _default_uri_flat_d is None:
+        _default_uri_flat_d = _flat_map_nodes(_get_default_uri_map(), '', dict())
+    return _default_uri_flat_d
+
+
+def __getattr__(name):
+    """Returns default_uri_map, building it the first time it is referenced from outside this module. See PEP 562.
+
+    :param name: Name of the module attribute
+    :type name: str
+    :return: Value for name
+    :rtype: dict
+    """
+    if name == 'default_uri_map':
+        return _get_default_uri_map()
+    raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(name))
+
+
+def cli_to_api(action):
+    """Converts a MAPS rule action, or list of actions, entered using CLI syntax to API syntax
+
+    :param action: MAPS rule action or list of MAPS rule actions
+    :type action: str, list, tuple
+    :return: Action in API syntax. Actions without a conversion are returned as is. A list if action is a list or tuple
+    :rtype: str, list
+    """
+    convert = _cli_to_api_convert.get
+    if isinstance(action, (list, tuple)):
+        return [convert(buf, buf) for buf in action]  # Rules typically have several actions so convert them all at once
+    return convert(action, action)
 
 
 def mask_ip_addr(addr, keep_last=True):
-    """Replaces IP address with xxx.xxx.xxx.123 or all x depending on keep_last
+    """Replaces IP address with xxx.xxx.xxx.123 or all x depending on keep_last. IPv6 addresses are masked the same way
+    using ':' as the separator, xxx:xxx:xxx:123
 
     :param addr: IP address
     :type addr: str
@@ -829,13 +976,16 @@ def mask_ip_addr(addr, keep_last=True):
     :return: Masked IP
     :rtype: str
     """
-    tip = ''
-    if isinstance(addr, str):
-        tl = addr.split('.')
-        for i in range(0, len(tl) - 1):
-            tip += 'xxx.'
-        tip += tl[len(tl) - 1] if keep_last else 'xxx'
-    return tip
+    if not isinstance(addr, str):
+        return ''
+    sep = '.'
+    if ':' in addr and '.' not in addr:  # IPv4 mapped IPv6 addresses are masked as IPv4
+        try:
+            ipaddress.IPv6Address(addr)
+            sep = ':'
+        except ValueError:
+            pass  # Not an IPv6 address so mask it the same way as before IPv6 support was added
+    return ('xxx' + sep) * addr.count(sep) + (addr[addr.rfind(sep) + 1:] if keep_last else 'xxx')
 
 
 def vfid_to_str(vfid):
@@ -857,84 +1007,197 @@ def vfid_to_str(vfid):
         buf = '. FIDs must be integers, type int, in the range 1-128.'
         brcdapi_log.exception('Invalid FID. Type: ' + str(type(vfid)) + '. Value: ' + str(vfid) + buf, echo=True)
         raise VirtualFabricIdError
-    return _VF_ID + str(vfid)
+    return _vf_id_str_t[vfid] if type(vfid) is int else _VF_ID + str(vfid)  # A bool passes the checks above
+
+
+def _flat_uri_map(map_d):
+    """Returns all leaves in a URI map, including leaves within leaves, as a flat dictionary. See add_uri_map()
+
+    :param map_d: URI map. Typically session['uri_map']
+    :type map_d: dict
+    :return: Key is the leaf path. Value is the leaf in map_d (not a copy)
+    :rtype: dict
+    """
+    rd = dict()
+    for d in map_d.values():
+        if isinstance(d, dict):
+            path = d.get('path')
+            if path is not None:
+                rd[sys.intern(path)] = d  # The keys are static so interning them is free after the map is built
+            rd.update(_flat_uri_map(d))  # Leaves can contain leaves, such as operations/show-status/message-id
+
+    return rd
+
+
+def _session_uri_flat(uri_map_d):
+    """Returns the flat dictionary of leaves added to the session as uri_flat. See add_uri_map()
+
+    :param uri_map_d: Session URI map
+    :type uri_map_d: dict
+    :return: Key is the leaf path. Leaves in 'running' are also keyed without 'running/'. Value is the leaf in uri_map_d
+    :rtype: dict
+    """
+    rd = _flat_uri_map(uri_map_d)
+    for k, d in [(k, d) for k, d in rd.items() if k.startswith('running/')]:
+        rd.setdefault(sys.intern(k[8:]), d)  # A real path always takes precedence over an alias
+
+    return rd
+
+
+def _copy_uri_map(map_d):
+    """Returns a copy of a URI map in which every dictionary is copied but all other values are shared with map_d. See
+    add_uri_map()
+
+    Branches, leaves, and dictionaries within leaves, such as the operations/show-status/message-id leaf within the
+    show-status leaf, are new dictionaries so that brcdapi_rest can update op and methods in the leaves of one session
+    without affecting another. brcdapi_rest replaces these values rather than modifying them so the values themselves,
+    such as the methods lists, do not need to be copied.
+
+    :param map_d: URI map
+    :type map_d: dict
+    :return: Copy of map_d
+    :rtype: dict
+    """
+    return {k: _copy_uri_map(v) if isinstance(v, dict) else v for k, v in map_d.items()}
+
+
+# add_uri_map() keeps the URI map built for each unique brocade-module-version response. Switches running the same
+# version of FOS return the same response so the map only needs to be built once. The key is repr() of the module list.
+# The value is a tuple of the URI map and the lists of errors found building it, error_mod_l and ml in add_uri_map().
+_uri_map_cache_d = dict()
+_URI_MAP_CACHE_MAX = 16  # Maximum number of maps in _uri_map_cache_d. Well above the number of FOS versions in use
 
 
 def add_uri_map(session, rest_d):
     """Builds out the URI map and adds it to the session. Intended to be called once immediately after login
 
+    Each leaf in the session uri_map is a shallow copy of the module dictionary returned from FOS with area, fid,
+    methods, op, uri, and path added. path is the uri with the leading '/rest/' stripped out, as returned from
+    split_uri().
+
+    The same leaves are also added to the session in uri_flat, a flat dictionary keyed by path, so that session_cntl()
+    can find a leaf with a single dictionary lookup. Leaves in 'running' are also keyed by path without the leading
+    'running/' because callers historically omit it. Results from format_uri() are saved in the session in
+    _format_uri_d. Since it is rebuilt here, calling add_uri_map() again clears any previously formatted URIs. The
+    leaves must remain mutable dictionaries because brcdapi.brcdapi_rest updates op and methods in place after polling
+    OPTIONS. _method_d, the URIs for each method used by uris_for_method(), is also cleared.
+
     :param session: Session dictionary returned from brcdapi.brcdapi_rest.login()
     :type session: dict
     :param rest_d: Object returned from FOS for 'brocade-module-version'
     :type rest_d: dict
     """
-    global default_uri_map
+    global _uri_map_cache_d
 
-    ml = list()
+    ml, error_mod_l = list(), list()
     try:
         mod_l = rest_d['brocade-module-version']['module']
     except KeyError:
         brcdapi_log.exception('ERROR: Invalid data in rest_d parameter.', echo=True)
         return
 
-    # Add each item to the session uri_map
-    uri_map_d = dict()
-    session.update(uri_map=uri_map_d)
-    for mod_d in mod_l:
-        to_process_l = list()
-
-        # Create a list of individual modules that need to be parsed
-        try:
-            uri = mod_d['uri']
-            # The running leaves all have individual requests while all else are 1:1 requests.
-            if '/rest/running/' in uri:
-                add_l = mod_d['objects'].get('object')
-                if isinstance(add_l, list):
-                    base_l = uri.split('/')[2:]
-                    for buf_l in [[buf] for buf in add_l]:
-                        to_process_l.append(base_l + buf_l)
-            else:
-                to_process_l.append(uri.split('/')[2:])
-        except (IndexError, KeyError):
-            brcdapi_log.exception(['', 'ERROR: Unexpected value in: ' + pprint.pformat(mod_d), ''], echo=True)
-            continue
-
-        # Parse each module
-        for uri_l in to_process_l:
-
-            # Find the dictionary in the default URI map
-            d, k, default_d, last_d = None, None, default_uri_map, uri_map_d
-            for k in uri_l:
-                if default_d is not None:
-                    default_d = default_d.get(k)
-                d = last_d.get(k)
-                if d is None:
-                    d = dict()
-                    last_d.update({k: d})
-                last_d = d
-
-            # Add this module (API request) to the URI map, uri_map, in the session object.
-            if isinstance(d, dict):
-                new_mod_d = copy.deepcopy(mod_d)
-                new_uri = uri + '/' + k if '/rest/running/' in uri else uri
-                if isinstance(default_d, dict):
-                    new_mod_d.update(area=default_d.get('area'),
-                                     fid=default_d.get('fid'),
-                                     methods=gen_util.convert_to_list(default_d.get('methods')),
-                                     op=op_no)
-                    new_mod_d['uri'] = new_uri
-                    last_d.update(new_mod_d)
+    # If a map was already built from the same module list, give this session its own copy because the leaves are
+    # modified by brcdapi_rest. The errors found when it was built are reported again below.
+    cache_key = repr(mod_l)
+    cache_t = _uri_map_cache_d.get(cache_key)
+    if cache_t is not None:
+        uri_map_d, error_mod_l, ml = cache_t
+        uri_map_d = _copy_uri_map(uri_map_d)
+        session.update(uri_map=uri_map_d)
+
+    else:
+        # Add each item to the session uri_map
+        uri_map_d, default_flat_d = dict(), _get_default_uri_flat()
+        session.update(uri_map=uri_map_d)
+        for mod_d in mod_l:
+            to_process_l = list()
+
+            # Create a list of individual modules that need to be parsed
+            try:
+                uri = mod_d['uri']
+                # The running leaves all have individual requests while all else are 1:1 requests.
+                if '/rest/running/' in uri:
+                    add_l = mod_d['objects'].get('object')
+                    if isinstance(add_l, list):
+                        base_l = uri.split('/')[2:]
+                        for buf_l in [[buf] for buf in add_l]:
+                            to_process_l.append(base_l + buf_l)
+                else:
+                    to_process_l.append(uri.split('/')[2:])
+            except (IndexError, KeyError):
+                error_mod_l.append(mod_d)
+                continue
+
+            # Parse each module
+            for uri_l in to_process_l:
+
+                # Find the dictionary in the default URI map and where it goes in the session URI map
+                d, k, default_d, last_d = None, None, default_flat_d.get('/'.join(uri_l)), uri_map_d
+                for k in uri_l:
+                    try:
+                        d = last_d[k]
+                    except KeyError:
+                        d = last_d[k] = dict()  # Only the first URI in each branch gets here so KeyError is unusual
+                    last_d = d
+
+                # Add this module (API request) to the URI map, uri_map, in the session object.
+                if isinstance(d, dict):
+                    new_mod_d = dict(mod_d)  # Only top level keys are modified so the nested objects can be shared
+                    new_uri = uri + '/' + k if '/rest/running/' in uri else uri
+                    if isinstance(default_d, dict):
+                        # methods is documented as a list but it's a tuple in default_uri_map. Sessions copied from the
+                        # cached map share this list so it must only ever be replaced, never modified in place.
+                        new_mod_d.update(area=default_d.get('area'),
+                                         fid=default_d.get('fid'),
+                                         methods=list(default_d.get('methods', ())),
+                                         op=op_no,
+                                         uri=new_uri,
+                                         path='/'.join(split_uri(new_uri)))
+                        last_d.update(new_mod_d)
+                    else:
+                        ml.append('UNKNOWN URI: ' + new_uri)
                 else:
-                    ml.append('UNKNOWN URI: ' + new_uri)
-            else:
-                brcdapi_log.exception(['', 'ERROR: Unexpected value in: ' + pprint.pformat(mod_d), ''], echo=True)
+                    error_mod_l.append(mod_d)
+
+        if len(_uri_map_cache_d) >= _URI_MAP_CACHE_MAX:
+            _uri_map_cache_d.clear()  # Only expected if something is logging in to switches with many FOS versions
+        _uri_map_cache_d[cache_key] = (_copy_uri_map(uri_map_d), error_mod_l, ml)
 
+    session.update(uri_flat=_session_uri_flat(uri_map_d), _format_uri_d=dict(), _method_d=None)
+
+    # Formatting the modules is only done once and only if there was an error
+    if len(error_mod_l) > 0:
+        import pprint
+        brcdapi_log.exception(['', 'ERROR: Unexpected value in: ' + pprint.pformat(error_mod_l), ''], echo=True)
     if len(ml) > 0:
         brcdapi_log.log(ml, echo=True)
 
     return
 
 
+@functools.lru_cache(maxsize=1024)
+def _split_uri_t(uri, run_op_out):
+    """Does the work for split_uri(). The same URIs are split over and over again so the results are cached. Since the
+    cached value is shared, it is a tuple. The segments are interned because they are typically used as URI map keys.
+
+    :param uri: URI
+    :type uri: str
+    :param run_op_out: If True, also remove 'running' and 'operations'
+    :type run_op_out: bool
+    :return: URI split into a tuple with leading '/rest/' stripped out
+    :rtype: tuple
+    """
+    uri_l, i = uri.split('/'), 0
+    if len(uri_l) > i and uri_l[i] == '':
+        i += 1
+    if len(uri_l) > i and uri_l[i] == 'rest':
+        i += 1
+    if run_op_out and len(uri_l) > i and uri_l[i] in ('running', 'operations'):
+        i += 1
+
+    return tuple(sys.intern(buf) for buf in uri_l[i:])  # Same segments as the interned URI map keys
+
+
 def split_uri(uri, run_op_out=False):
     """From a URI: Removes '/rest/'. Optionally removes 'running' and 'operations'. Returns a list of elements
 
@@ -945,15 +1208,22 @@ def split_uri(uri, run_op_out=False):
     :return: URI split into a list with leading '/rest/' stripped out
     :rtype: list
     """
-    uri_l = uri.split('/')
-    if len(uri_l) > 0 and uri_l[0] == '':
-        uri_l.pop(0)
-    if len(uri_l) > 0 and uri_l[0] == 'rest':
-        uri_l.pop(0)
-    if run_op_out and len(uri_l) > 0 and uri_l[0] in ('running', 'operations'):
-        uri_l.pop(0)
+    return list(_split_uri_t(uri, bool(run_op_out)))
 
-    return uri_l
+
+def _strip_uri(uri):
+    """Same as '/'.join(split_uri(uri)) but without splitting the URI into a list and joining it back together
+
+    :param uri: URI
+    :type uri: str
+    :return: uri with the leading '/rest/' stripped out
+    :rtype: str
+    """
+    if uri.startswith('/'):
+        uri = uri[1:]
+    if uri.startswith('rest/'):
+        return uri[5:]
+    return '' if uri == 'rest' else uri
 
 
 def session_cntl(session, in_uri):
@@ -966,10 +1236,19 @@ def session_cntl(session, in_uri):
     :return: Control dictionary associated with uri. None if not found
     :rtype: dict, None
     """
+    # Try the flat dictionary of leaves first. Most callers pass the path so try it as is before doing any string work.
+    # Branches and sessions without uri_flat fall through to a search of uri_map.
+    uri_flat_d = session.get('uri_flat', dict())
+    d = uri_flat_d.get(in_uri)
+    if d is not None:
+        return d
     if 'operations/show-status/message-id/' in in_uri:
-        return None
+        return None  # No leaf path contains this so it's only checked after the first lookup misses
+    uri = _strip_uri(in_uri)
+    d = uri_flat_d.get(uri)  # Leaves in 'running' are also keyed without 'running/' so this covers the old way too
+    if d is not None:
+        return d
 
-    uri = '/'.join(split_uri(in_uri))
     d = gen_util.get_key_val(session.get('uri_map'), uri)
     if d is None:
         d = gen_util.get_key_val(session.get('uri_map'), 'running/' + uri)  # The old way didn't include 'running/'
@@ -989,9 +1268,30 @@ def format_uri(session, uri, fid):
     :return: Full URI
     :rtype: str
     """
+    # The same URIs are typically formatted over and over again so the results are saved in the session
+    # bool is a subclass of int so True would find the URI formatted for FID 1. Only None and int are saved.
+    key, save = (uri, fid), fid is None or type(fid) is int
+    if save:
+        try:
+            return session['_format_uri_d'][key]
+        except (KeyError, TypeError):
+            pass  # Not formatted yet or add_uri_map() was never called. Format it below.
+
     d = session_cntl(session, uri)
+    if d is None:
+        return '/rest/' + uri  # Not saved. These are typically URIs with a unique ID, such as show-status/message-id
+
+    # vfid_to_str() returns an empty string when fid is None so skip the call and concatenation altogether
+    full_uri = d['uri']
+    if d['fid'] is not None and fid is not None:
+        full_uri += vfid_to_str(fid)
+    format_uri_d = session.get('_format_uri_d')
+    if save and isinstance(format_uri_d, dict):
+        if len(format_uri_d) >= _FORMAT_URI_MAX:
+            format_uri_d.clear()  # Keeps the memory bounded if something is formatting an unusual number of URIs
+        format_uri_d[key] = full_uri
 
-    return '/rest/' + uri if d is None else d['uri'] if d['fid'] is None else d['uri'] + vfid_to_str(fid)
+    return full_uri
 
 
 def uri_d(session, uri):
@@ -1001,25 +1301,46 @@ def uri_d(session, uri):
     :type session: dict
     :param uri: URI in slash notation
     :type uri: str
+    :return: Dictionary in the URI map. None if not found
+    :rtype: dict, None
     """
+    # Leaves are in uri_flat. Keys without 'running/' are aliases, which uri_d() doesn't accept, hence the path check.
+    d = session.get('uri_flat', dict()).get(uri)
+    if d is not None and d.get('path') == uri:
+        return d
+
     d = gen_util.get_struct_from_obj(session.get('uri_map'), uri)
-    if not isinstance(d, dict) and gen_util.get_key_val(default_uri_map, uri) is None:
+    if not isinstance(d, dict) and gen_util.get_key_val(_get_default_uri_map(), uri) is None:
         brcdapi_log.log('UNKNOWN URI: ' + uri + '. Check the log for details.', echo=True)  # For humans
         brcdapi_log.exception('UNKNOWN URI: ' + uri, echo=True)  # For the log
     return d
 
 
 def _get_uri(map_d):
+    """Returns the path of every leaf in a URI map in the same order as the map. The map is walked with a stack of
+    iterators rather than recursively.
+
+    :param map_d: URI map, or a branch of a URI map
+    :type map_d: dict, None
+    :return: List of paths
+    :rtype: list
+    """
     rl = list()
-    if isinstance(map_d, dict):
-        for d in map_d.values():
+    if not isinstance(map_d, dict):
+        return rl
+
+    stack_l = [iter(map_d.values())]
+    while len(stack_l) > 0:
+        for d in stack_l[-1]:
             if isinstance(d, dict):
                 uri = d.get('uri')
-                if uri is not None:
-                    rl.append('/'.join(split_uri(uri)))
-                    continue
-                else:
-                    rl.extend(_get_uri(d))
+                if uri is None:
+                    stack_l.append(iter(d.values()))
+                    break  # Finish this branch before picking up where this one left off
+                path = d.get('path')  # Precomputed in add_uri_map()
+                rl.append('/'.join(split_uri(uri)) if path is None else path)
+        else:
+            stack_l.pop()
 
     return rl
 
@@ -1027,6 +1348,9 @@ def _get_uri(map_d):
 def uris_for_method(session, http_method, uri_d_flag=False):
     """Returns the dictionaries or URIs supporting a certain HTTP method.
 
+    The URIs supporting each method are determined once and saved in the session in _method_d. add_uri_map() and
+    brcdapi_rest, when it updates the methods after polling OPTIONS, clear it so that it is rebuilt on the next call.
+
     :param session: Session object returned from login()
     :type session: dict
     :param http_method: The HTTP method to look for
@@ -1036,19 +1360,21 @@ def uris_for_method(session, http_method, uri_d_flag=False):
     :return: List of URIs or URI dictionaries depending on uri_d_flag
     :rtype: list
     """
-    rl, uri_map_d = list(), session.get('uri_map')
+    uri_map_d = session.get('uri_map')
     if not isinstance(uri_map_d, dict):
-        return rl  # Just in case someone calls this method before logging in.
+        return list()  # Just in case someone calls this method before logging in.
 
-    for uri in _get_uri(uri_map_d.get('running')) + _get_uri(uri_map_d.get('operations')):
-        d = uri_d(session, uri)
-        if http_method in gen_util.convert_to_list(d.get('methods')):
-            if uri_d_flag:
-                rl.append(d)
-            else:
-                rl.append(uri)
+    method_d = session.get('_method_d')
+    if method_d is None:
+        method_d = dict()
+        for uri in _get_uri(uri_map_d.get('running')) + _get_uri(uri_map_d.get('operations')):
+            d = uri_d(session, uri)
+            for method in set(d.get('methods', list())):  # add_uri_map() and brcdapi_rest always set methods to a list
+                method_d.setdefault(method, list()).append((uri, d))
+        session['_method_d'] = method_d
 
-    return rl
+    i = 1 if uri_d_flag else 0
+    return [t[i] for t in method_d.get(http_method, list())]
 
 
 def _int_dict_to_uri(convert_dict):
@@ -1060,13 +1386,15 @@ def _int_dict_to_uri(convert_dict):
     :rtype: list
     """
     rl = list()
-    if isinstance(convert_dict, dict):
-        for k, v in convert_dict.items():
-            if isinstance(v, dict):
-                for uri_l in dict_to_uri(v):
-                    rl.append(str(k) + '/' + '/'.join(uri_l))
-            else:
-                rl.append('/' + str(k))
+    if not isinstance(convert_dict, dict) or len(convert_dict) == 0:
+        return rl
+
+    for k, v in convert_dict.items():
+        if isinstance(v, dict):
+            key = str(k)
+            rl.extend([key + '/' + buf for buf in dict_to_uri(v)])  # dict_to_uri() returns str, not lists
+        else:
+            rl.append('/' + str(k))
 
     return rl
 
@@ -1080,13 +1408,22 @@ def dict_to_uri(convert_dict):
     :rtype: list
     """
     rl = list()
-    if isinstance(convert_dict, dict):
-        for k, v in convert_dict.items():
-            if isinstance(v, dict):
-                for buf in dict_to_uri(v):
-                    rl.append(str(k) + '/' + buf)
-            else:
-                rl.append(str(k))
+    if not isinstance(convert_dict, dict) or len(convert_dict) == 0:
+        return rl
+
+    # Walked with a stack of iterators rather than recursively. Each entry is the iterator for a dictionary and the path
+    # to it, so the path is only built once per dictionary instead of once per leaf for every level.
+    stack_l = [(iter(convert_dict.items()), '')]
+    while len(stack_l) > 0:
+        item_iter, prefix = stack_l[-1]
+        for k, v in item_iter:
+            if not isinstance(v, dict):
+                rl.append(prefix + str(k))
+            elif len(v) > 0:  # Empty dictionaries add nothing so there is no need to walk them
+                stack_l.append((iter(v.items()), prefix + str(k) + '/'))
+                break  # Finish this dictionary before picking up where this one left off
+        else:
+            stack_l.pop()
 
     return rl
 